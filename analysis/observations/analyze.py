@@ -54,24 +54,24 @@ def provider(name: str) -> pd.DataFrame:
     if name == "Tomorrow.io":
         df["fc_mph"] = df["windSpeed"] * MS2MPH
         df["fcg_mph"] = df["windGust"] * MS2MPH
-        df["valid"] = pd.to_datetime(df["time"], utc=True)
+        df["valid"] = pd.to_datetime(df["time"], utc=True, format="ISO8601")
     elif name == "Tempest Forecast":
         df["fc_mph"] = df["wind_avg"] * MS2MPH
         df["fcg_mph"] = df["wind_gust"] * MS2MPH
-        df["valid"] = pd.to_datetime(df["time_iso"], utc=True)
+        df["valid"] = pd.to_datetime(df["time_iso"], utc=True, format="ISO8601")
     elif name == "Open-Meteo":
         df["fc_mph"] = df["wind_speed_10m"] * KMH2MPH
         df["fcg_mph"] = df["wind_gusts_10m"] * KMH2MPH
-        df["valid"] = pd.to_datetime(df["time"], utc=True)
+        df["valid"] = pd.to_datetime(df["time"], utc=True, format="ISO8601")
     elif name == "NWS Forecast":
         df["fc_mph"] = df["windSpeed"].astype(str).str.extract(r"(\d+)").astype(float).iloc[:, 0]
         df["fcg_mph"] = np.nan
-        df["valid"] = pd.to_datetime(df["startTime"], utc=True)
+        df["valid"] = pd.to_datetime(df["startTime"], utc=True, format="ISO8601")
     elif name == "COOSDP":
         df["fc_mph"] = df["wind_speed_mph"]
         df["fcg_mph"] = df["wind_gust_mph"]
-        df["valid"] = pd.to_datetime(df["time"], utc=True)
-    df["stale_hr"] = (pd.to_datetime(df["submittedAt"], utc=True) - df["valid"]).dt.total_seconds() / 3600
+        df["valid"] = pd.to_datetime(df["time"], utc=True, format="ISO8601")
+    df["stale_hr"] = (pd.to_datetime(df["submittedAt"], utc=True, format="ISO8601") - df["valid"]).dt.total_seconds() / 3600
     return df[["submittedAt", "fc_mph", "fcg_mph", "stale_hr"]]
 
 
@@ -9,6 +9,9 @@
 //
 // GET /api/forecast?lat=35.34&lon=-120.83&days=3&station=9412110&minTide=2.5
 //   Convenience form covering the common fields.
+//
+// Responses are compact JSON. Add ?pretty to either form for indented
+// output when reading it by hand.
 
 import { buildForecast } from "../../public/js/core/forecast.js";
 import { initConfig } from "../../public/js/config.js";
@@ -28,8 +31,8 @@ async function ensureConfig(env, request) {
   }
 }
 
-function json(body, status = 200) {
-  return new Response(JSON.stringify(body, null, 2), {
+function json(body, status = 200, pretty = false) {
+  return new Response(JSON.stringify(body, null, pretty ? 2 : undefined), {
     status,
     headers: {
       "content-type": "application/json",
@@ -38,7 +41,7 @@ function json(body, status = 200) {
   });
 }
 
-async function handle(payload) {
+async function handle(payload, pretty) {
   const lat = Number(payload.lat);
   const lon = Number(payload.lon);
   if (!Number.isFinite(lat) || !Number.isFinite(lon)) {
@@ -51,11 +54,12 @@ async function handle(payload) {
     prefs: payload.prefs ?? {},
   };
   const forecast = await buildForecast(location, { days: payload.days });
-  return json(forecast);
+  return json(forecast, 200, pretty);
 }
 
 export async function onRequestPost({ request, env }) {
   await ensureConfig(env, request);
+  const pretty = new URL(request.url).searchParams.has("pretty");
   let payload;
   try {
     payload = await request.json();
@@ -63,7 +67,7 @@ export async function onRequestPost({ request, env }) {
     return json({ error: "request body must be JSON" }, 400);
   }
   try {
-    return await handle(payload);
+    return await handle(payload, pretty);
   } catch (err) {
     return json({ error: err.message }, 502);
   }
@@ -72,6 +76,7 @@ export async function onRequestPost({ request, env }) {
 export async function onRequestGet({ request, env }) {
   await ensureConfig(env, request);
   const q = new URL(request.url).searchParams;
+  const pretty = q.has("pretty");
   const payload = {
     lat: q.get("lat"),
     lon: q.get("lon"),
@@ -92,7 +97,7 @@ export async function onRequestGet({ request, env }) {
     payload.prefs.waves = { enabled: true };
   }
   try {
-    return await handle(payload);
+    return await handle(payload, pretty);
   } catch (err) {
     return json({ error: err.message }, 502);
   }
@@ -15,7 +15,17 @@ export const BEAUFORT = [
   { level: 12, name: "Hurricane", max: Infinity },
 ];
 
+// Every level below hurricane tops out at a whole number of mph, so
+// "mph <= max" is the same test as "ceil(mph) <= max" and the level for
+// each whole mph up to 72 can be read from a table built once. Speeds
+// off the table (hurricane force, negative, NaN) take the scan below.
+const BY_CEIL_MPH = Array.from({ length: 73 }, (_, mph) =>
+  BEAUFORT.find((b) => mph <= b.max)
+);
+
 export function beaufortFromMph(mph) {
+  const hit = BY_CEIL_MPH[Math.ceil(mph)];
+  if (hit) return hit;
   for (const b of BEAUFORT) {
     if (mph <= b.max) return b;
   }
@@ -43,21 +43,46 @@ function hexToRgb(hex) {
   ];
 }
 
-function mix(hexA, hexB, t) {
-  const a = hexToRgb(hexA);
-  const b = hexToRgb(hexB);
+function mixRgb(a, b, t) {
   const c = a.map((v, i) => Math.round(v + (b[i] - v) * t));
   return `rgb(${c[0]}, ${c[1]}, ${c[2]})`;
 }
 
+function mix(hexA, hexB, t) {
+  return mixRgb(hexToRgb(hexA), hexToRgb(hexB), t);
+}
+
+// rampColor runs for every hour stripe on the home page and every row
+// of the day view, but hour scores are averages of category positions
+// and take only a handful of values. Each scheme keeps its anchors
+// parsed once and the colors it has produced; an entry is rebuilt if
+// config supplies different anchors.
+const ramps = new Map();
+
+function rampFor(schemeId) {
+  const anchors = schemeAnchors(schemeId);
+  let ramp = ramps.get(schemeId);
+  if (ramp?.anchors !== anchors) {
+    ramp = { anchors, rgb: anchors.map(hexToRgb), colors: new Map() };
+    ramps.set(schemeId, ramp);
+  }
+  return ramp;
+}
+
 // Continuous ramp position, GIS style: score 0 is the excellent anchor,
 // 1/3 acceptable, 2/3 marginal, 1 the notForMe anchor, with scores in
 // between landing on intermediate shades.
 export function rampColor(score, schemeId) {
-  const anchors = schemeAnchors(schemeId);
-  const t = Math.min(Math.max(score, 0), 1) * (anchors.length - 1);
-  const i = Math.min(Math.floor(t), anchors.length - 2);
-  return mix(anchors[i], anchors[i + 1], t - i);
+  const ramp = rampFor(schemeId);
+  let color = ramp.colors.get(score);
+  if (color === undefined) {
+    const { rgb } = ramp;
+    const t = Math.min(Math.max(score, 0), 1) * (rgb.length - 1);
+    const i = Math.min(Math.floor(t), rgb.length - 2);
+    color = mixRgb(rgb[i], rgb[i + 1], t - i);
+    ramp.colors.set(score, color);
+  }
+  return color;
 }
 
 // Chip color for the sunrise/sunset glow prediction: slate gray for a
@@ -175,16 +175,18 @@ export function evaluateHour(hour, prefs) {
   if (prefs.tide.enabled) metrics.tide = evalTide(hour, prefs);
   if (prefs.waves.enabled) metrics.waves = evalWaves(hour, prefs);
   const overall = worst(Object.values(metrics).map((m) => m.category));
+  const wind = CATEGORY_VALUE[metrics.wind.category];
   const comfort = Math.max(
     CATEGORY_VALUE[metrics.temp.category],
     CATEGORY_VALUE[metrics.conditions.category]
   );
-  const components = [CATEGORY_VALUE[metrics.wind.category], comfort];
-  if (metrics.waves) components.push(CATEGORY_VALUE[metrics.waves.category]);
+  const waves = metrics.waves ? CATEGORY_VALUE[metrics.waves.category] : null;
   const pinned =
-    components.includes(1) || metrics.tide?.category === "notForMe";
-  const score = pinned
-    ? 1
-    : components.reduce((sum, v) => sum + v, 0) / components.length;
+    wind === 1 || comfort === 1 || waves === 1 ||
+    metrics.tide?.category === "notForMe";
+  let score = 1;
+  if (!pinned) {
+    score = waves == null ? (wind + comfort) / 2 : (wind + comfort + waves) / 3;
+  }
   return { metrics, overall, score };
 }
@@ -7,15 +7,68 @@ import { fetchTides } from "../providers/noaatides.js";
 
 // Treat a location-local "YYYY-MM-DDTHH:mm" string as if it were UTC to
 // get a comparable millisecond value. Sun times (true UTC) are shifted
-// into the same frame with the location's UTC offset.
+// into the same frame with the location's UTC offset. The format is
+// fixed-width, so the fields are sliced out directly rather than
+// building a new string for the date parser on every hour.
 function localMs(iso) {
-  return Date.parse(iso + ":00Z");
+  return Date.UTC(
+    +iso.slice(0, 4),
+    +iso.slice(5, 7) - 1,
+    +iso.slice(8, 10),
+    +iso.slice(11, 13),
+    +iso.slice(14, 16)
+  );
 }
 
 function localIsoFromUtc(utcMs, offsetSeconds) {
   return new Date(utcMs + offsetSeconds * 1000).toISOString().slice(0, 16);
 }
 
+// UTC offset in seconds of `timeZone` on a local "YYYY-MM-DD" date.
+// Open-Meteo reports a single offset, the one in effect now, which is
+// an hour wrong for days past a DST switch inside the forecast. The
+// offset is read at 12:00 UTC, clear of the early-morning switch for
+// any zone within twelve hours of UTC. It only changes at a DST
+// boundary, so it is memoized per zone and date. The formatter that
+// reads it, the costly part to set up, is kept per zone.
+const offsetCache = new Map();
+const zoneFormats = new Map();
+
+function zoneFormat(timeZone) {
+  let format = zoneFormats.get(timeZone);
+  if (format === undefined) {
+    format = new Intl.DateTimeFormat("en-US", {
+      timeZone,
+      hourCycle: "h23",
+      year: "numeric",
+      month: "numeric",
+      day: "numeric",
+      hour: "numeric",
+      minute: "numeric",
+    });
+    zoneFormats.set(timeZone, format);
+  }
+  return format;
+}
+
+function utcOffsetOn(timeZone, date) {
+  const key = `${timeZone} ${date}`;
+  let offset = offsetCache.get(key);
+  if (offset === undefined) {
+    const at = Date.parse(`${date}T12:00:00Z`);
+    const parts = {};
+    for (const { type, value } of zoneFormat(timeZone).formatToParts(at)) {
+      parts[type] = Number(value);
+    }
+    const wall = Date.UTC(
+      parts.year, parts.month - 1, parts.day, parts.hour, parts.minute
+    );
+    offset = (wall - at) / 1000;
+    offsetCache.set(key, offset);
+  }
+  return offset;
+}
+
 // Build the full evaluated forecast for one location.
 //
 // location: { name, lat, lon, prefs } (prefs may be partial; defaults fill in)
@@ -32,37 +85,57 @@ export async function buildForecast(location, options = {}) {
   const prefs = mergePrefs(location.prefs, options.globalPrefs);
   const warnings = [];
 
-  const weather = await fetchWeather(location.lat, location.lon, days);
+  // The three sources are independent, so request them together and
+  // wait on the slowest rather than the sum. Weather is required and
+  // its failure rejects the whole forecast; waves and tides degrade to
+  // a warning.
+  const [weather, marineResult, tidesResult] = await Promise.all([
+    fetchWeather(location.lat, location.lon, days),
+    prefs.waves.enabled
+      ? fetchMarine(location.lat, location.lon, days).catch((err) => err)
+      : new Map(),
+    prefs.tide.enabled && prefs.tide.stationId
+      ? fetchTides(prefs.tide.stationId, Date.now(), days).catch((err) => err)
+      : new Map(),
+  ]);
 
-  let marine = new Map();
-  if (prefs.waves.enabled) {
-    try {
-      marine = await fetchMarine(location.lat, location.lon, days);
-    } catch (err) {
-      warnings.push(`Wave data unavailable: ${err.message}`);
-    }
+  let marine = marineResult;
+  if (marine instanceof Error) {
+    warnings.push(`Wave data unavailable: ${marine.message}`);
+    marine = new Map();
   }
 
-  let tides = new Map();
-  if (prefs.tide.enabled && prefs.tide.stationId) {
-    try {
-      tides = await fetchTides(prefs.tide.stationId, Date.now(), days);
-    } catch (err) {
-      warnings.push(`Tide data unavailable: ${err.message}`);
-    }
+  let tides = tidesResult;
+  if (tides instanceof Error) {
+    warnings.push(`Tide data unavailable: ${tides.message}`);
+    tides = new Map();
   }
 
-  // Group weather hours by local calendar date, in order.
-  const byDate = new Map();
+  // Group weather hours by local calendar date. Open-Meteo returns them
+  // in time order, so each date is one consecutive run: start a new
+  // group whenever the date changes instead of probing a map per hour.
+  // Groups hold [iso, record] pairs pointing at the provider's records
+  // rather than copies of them.
+  const byDate = [];
+  let group = null;
   for (const [iso, record] of weather.hours) {
     const date = iso.slice(0, 10);
-    if (!byDate.has(date)) byDate.set(date, []);
-    byDate.get(date).push({ iso, ...record });
+    if (group?.[0] !== date) {
+      group = [date, []];
+      byDate.push(group);
+    }
+    group[1].push([iso, record]);
   }
 
-  const offset = weather.utcOffsetSeconds;
-  const todayLocal = localIsoFromUtc(Date.now(), offset).slice(0, 10);
-  const nowLocalMs = localMs(localIsoFromUtc(Date.now(), offset));
+  const nowLocalMs = Date.now() + weather.utcOffsetSeconds * 1000;
+  const todayLocal = new Date(nowLocalMs).toISOString().slice(0, 10);
+  // Most weeks do not cross a DST switch. When the zone's offset on the
+  // last forecast date is still the current one, every date in between
+  // shares it and the per-date lookup is skipped.
+  const lastDate = byDate.at(-1)?.[0];
+  const offsetStable =
+    lastDate != null &&
+    utcOffsetOn(weather.timezone, lastDate) === weather.utcOffsetSeconds;
 
   const outDays = [];
   for (const [date, records] of byDate) {
@@ -70,39 +143,58 @@ export async function buildForecast(location, options = {}) {
     const [y, m, d] = date.split("-").map(Number);
     const sun = sunTimes({ y, m, d }, location.lat, location.lon);
     if (sun.firstLight == null || sun.lastLight == null) continue;
+    const offset = offsetStable
+      ? weather.utcOffsetSeconds
+      : utcOffsetOn(weather.timezone, date);
     const dawnLocal = sun.firstLight + offset * 1000;
     const duskLocal = sun.lastLight + offset * 1000;
+    // Each sun time is formatted once and shared by the day summary and
+    // the hour it falls in. Sunrise and sunset are also resolved into
+    // the local frame for the hour loop below to match against.
+    const sunLocal = {
+      firstLight: localIsoFromUtc(sun.firstLight, offset),
+      sunrise: localIsoFromUtc(sun.sunrise, offset),
+      sunset: localIsoFromUtc(sun.sunset, offset),
+      lastLight: localIsoFromUtc(sun.lastLight, offset),
+    };
+    const sunEvents = [];
+    for (const kind of ["sunrise", "sunset"]) {
+      if (sun[kind] == null) continue;
+      sunEvents.push({ kind, at: sun[kind] + offset * 1000, time: sunLocal[kind] });
+    }
 
     const hours = [];
-    for (const record of records) {
-      const start = localMs(record.iso);
+    for (const [iso, record] of records) {
+      const start = localMs(iso);
       const end = start + 3600000;
-      if (end <= dawnLocal || start >= duskLocal) continue;
+      // Records run in time order, so the first hour starting at or
+      // after dusk ends the day's daylight span.
+      if (start >= duskLocal) break;
+      if (end <= dawnLocal) continue;
       if (end <= nowLocalMs) continue; // skip hours already fully past
+      const sea = marine.get(iso);
       const hour = {
-        time: record.iso,
+        time: iso,
         tempF: record.tempF,
         weatherCode: record.weatherCode,
         windMph: record.windMph,
         windDirDeg: record.windDirDeg,
-        tideFt: tides.get(record.iso) ?? null,
-        waveFt: marine.get(record.iso)?.waveFt ?? null,
-        wavePeriodS: marine.get(record.iso)?.wavePeriodS ?? null,
-        waveDirDeg: marine.get(record.iso)?.waveDirDeg ?? null,
-        swellFt: marine.get(record.iso)?.swellFt ?? null,
-        swellPeriodS: marine.get(record.iso)?.swellPeriodS ?? null,
-        windWaveFt: marine.get(record.iso)?.windWaveFt ?? null,
+        tideFt: tides.get(iso) ?? null,
+        waveFt: sea?.waveFt ?? null,
+        wavePeriodS: sea?.wavePeriodS ?? null,
+        waveDirDeg: sea?.waveDirDeg ?? null,
+        swellFt: sea?.swellFt ?? null,
+        swellPeriodS: sea?.swellPeriodS ?? null,
+        windWaveFt: sea?.windWaveFt ?? null,
       };
       // Tag the hour that contains sunrise or sunset with the event and
       // its predicted color quality, judged from this hour's cloud
       // layers (see core/glow.js).
-      for (const [kind, utc] of [["sunrise", sun.sunrise], ["sunset", sun.sunset]]) {
-        if (utc == null) continue;
-        const eventLocal = utc + offset * 1000;
-        if (eventLocal >= start && eventLocal < end) {
+      for (const event of sunEvents) {
+        if (event.at >= start && event.at < end) {
           hour.sunEvent = {
-            kind,
-            time: localIsoFromUtc(utc, offset),
+            kind: event.kind,
+            time: event.time,
             quality: glowQuality(record),
           };
         }
@@ -111,16 +203,7 @@ export async function buildForecast(location, options = {}) {
     }
     if (hours.length === 0) continue;
 
-    outDays.push({
-      date,
-      sun: {
-        firstLight: localIsoFromUtc(sun.firstLight, offset),
-        sunrise: localIsoFromUtc(sun.sunrise, offset),
-        sunset: localIsoFromUtc(sun.sunset, offset),
-        lastLight: localIsoFromUtc(sun.lastLight, offset),
-      },
-      hours,
-    });
+    outDays.push({ date, sun: sunLocal, hours });
     if (outDays.length >= days) break;
   }
 
@@ -18,7 +18,10 @@ function julianDay(y, m, d) {
   );
 }
 
-function solarEvent(jd, lat, lon, zenithDeg, rising) {
+// Solar declination and the equation of time for a Julian day. These
+// depend only on the date, so one call serves all four of the day's
+// events.
+function solarGeometry(jd) {
   const t = (jd - 2451545.0) / 36525.0;
   const geomMeanLongSun =
     (280.46646 + t * (36000.76983 + t * 0.0003032)) % 360;
@@ -49,6 +52,11 @@ function solarEvent(jd, lat, lon, zenithDeg, rising) {
       1.25 * eccent * eccent * Math.sin(2 * geomMeanAnomSun * DEG)) /
       DEG);
 
+  return { declination, eqOfTime };
+}
+
+function solarEvent(jd, geometry, lat, lon, zenithDeg, rising) {
+  const { declination, eqOfTime } = geometry;
   const cosHA =
     (Math.cos(zenithDeg * DEG) -
       Math.sin(lat * DEG) * Math.sin(declination * DEG)) /
@@ -61,15 +69,32 @@ function solarEvent(jd, lat, lon, zenithDeg, rising) {
   return (jd - 2440587.5) * 86400000 + eventMin * 60000;
 }
 
+// The answer depends only on date and position, and the same spots are
+// asked about the same days on every refresh (and, in the API, on every
+// request an isolate serves), so results are memoized. Callers share the
+// returned object; it is frozen so one cannot alter another's copy.
+// API callers can send any coordinates, so the cache starts over once
+// it holds more than a few hundred entries.
+const CACHE_LIMIT = 512;
+const cache = new Map();
+
 // date: { y, m, d } for the location's local calendar date.
 // Returns { firstLight, sunrise, sunset, lastLight } in UTC epoch ms,
 // or null values at extreme latitudes.
 export function sunTimes(date, lat, lon) {
-  const jd = julianDay(date.y, date.m, date.d);
-  return {
-    firstLight: solarEvent(jd, lat, lon, 96, true), // civil dawn
-    sunrise: solarEvent(jd, lat, lon, 90.833, true),
-    sunset: solarEvent(jd, lat, lon, 90.833, false),
-    lastLight: solarEvent(jd, lat, lon, 96, false), // civil dusk
-  };
+  const key = `${date.y}-${date.m}-${date.d} ${lat} ${lon}`;
+  let times = cache.get(key);
+  if (times === undefined) {
+    const jd = julianDay(date.y, date.m, date.d);
+    const geo = solarGeometry(jd);
+    times = Object.freeze({
+      firstLight: solarEvent(jd, geo, lat, lon, 96, true), // civil dawn
+      sunrise: solarEvent(jd, geo, lat, lon, 90.833, true),
+      sunset: solarEvent(jd, geo, lat, lon, 90.833, false),
+      lastLight: solarEvent(jd, geo, lat, lon, 96, false), // civil dusk
+    });
+    if (cache.size >= CACHE_LIMIT) cache.clear();
+    cache.set(key, times);
+  }
+  return times;
 }
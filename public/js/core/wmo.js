@@ -11,7 +11,7 @@ export const CONDITION_CATEGORIES = [
   { id: "storm", label: "Thunderstorm / Severe" },
 ];
 
-export function categoryFromWmoCode(code) {
+function classify(code) {
   if (code === 0) return "sunny";
   if (code === 1 || code === 2) return "partly";
   if (code === 3) return "overcast";
@@ -23,19 +23,29 @@ export function categoryFromWmoCode(code) {
   return "overcast";
 }
 
+// WMO codes run 0-99. Classify them all once at load so the per-hour
+// lookup is an array read; anything outside the table takes the slow
+// path and gets the same answer.
+const CATEGORY_BY_CODE = Array.from({ length: 100 }, (_, code) => classify(code));
+
+export function categoryFromWmoCode(code) {
+  return CATEGORY_BY_CODE[code] ?? classify(code);
+}
+
+const NAMES = {
+  0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+  45: "Fog", 48: "Depositing rime fog",
+  51: "Light drizzle", 53: "Drizzle", 55: "Dense drizzle",
+  56: "Freezing drizzle", 57: "Dense freezing drizzle",
+  61: "Light rain", 63: "Rain", 65: "Heavy rain",
+  66: "Freezing rain", 67: "Heavy freezing rain",
+  71: "Light snow", 73: "Snow", 75: "Heavy snow", 77: "Snow grains",
+  80: "Light showers", 81: "Showers", 82: "Violent showers",
+  85: "Snow showers", 86: "Heavy snow showers",
+  95: "Thunderstorm", 96: "Thunderstorm with hail",
+  99: "Thunderstorm with heavy hail",
+};
+
 export function describeWmoCode(code) {
-  const names = {
-    0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-    45: "Fog", 48: "Depositing rime fog",
-    51: "Light drizzle", 53: "Drizzle", 55: "Dense drizzle",
-    56: "Freezing drizzle", 57: "Dense freezing drizzle",
-    61: "Light rain", 63: "Rain", 65: "Heavy rain",
-    66: "Freezing rain", 67: "Heavy freezing rain",
-    71: "Light snow", 73: "Snow", 75: "Heavy snow", 77: "Snow grains",
-    80: "Light showers", 81: "Showers", 82: "Violent showers",
-    85: "Snow showers", 86: "Heavy snow showers",
-    95: "Thunderstorm", 96: "Thunderstorm with hail",
-    99: "Thunderstorm with heavy hail",
-  };
-  return names[code] ?? `Weather code ${code}`;
+  return NAMES[code] ?? `Weather code ${code}`;
 }
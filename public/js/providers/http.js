@@ -0,0 +1,38 @@
+// Shared fetch wrapper for the data source clients. Browsers and the
+// Workers runtime already pool and reuse connections per origin, so
+// what is worth sharing here is resilience: a rate limit or a brief
+// upstream hiccup is retried with backoff before it surfaces as a
+// "data unavailable" message.
+
+const RETRY_STATUSES = new Set([429, 500, 502, 503, 504]);
+const RETRY_DELAYS_MS = [500, 1000];
+
+function sleep(ms) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+// Fetch options asking Cloudflare's edge to keep a successful upstream
+// response for `seconds`, so repeated /api/forecast calls for the same
+// spot skip the round trip to the source. `cf` is a Workers extension;
+// browsers ignore it and keep their normal HTTP caching. Error statuses
+// are never cached.
+export function edgeCache(seconds) {
+  return { cf: { cacheTtlByStatus: { "200-299": seconds, "400-599": -1 } } };
+}
+
+// Returns the Response for `url`, retrying network errors and the
+// transient statuses above. The last attempt's response is returned
+// as-is, ok or not, so callers keep their own error messages.
+export async function fetchWithRetry(url, init) {
+  for (let attempt = 0; ; attempt++) {
+    const last = attempt >= RETRY_DELAYS_MS.length;
+    try {
+      const res = await fetch(url, init);
+      if (last || !RETRY_STATUSES.has(res.status)) return res;
+      res.body?.cancel();
+    } catch (err) {
+      if (last) throw err;
+    }
+    await sleep(RETRY_DELAYS_MS[attempt]);
+  }
+}
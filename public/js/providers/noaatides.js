@@ -2,19 +2,39 @@
 // Uses MLLW datum in feet with station-local timestamps, which matches
 // the local timestamps Open-Meteo returns for nearby coordinates.
 
+import { fetchWithRetry, edgeCache } from "./http.js";
+
 const BASE_URL =
   "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter";
 
+// Predictions are astronomical and fixed for a station and date range
+// (which the URL carries), so the edge can hold them for hours.
+const EDGE_CACHE_SECONDS = 6 * 3600;
+
 function fmtDate(d) {
   const p = (n) => String(n).padStart(2, "0");
   return `${d.getUTCFullYear()}${p(d.getUTCMonth() + 1)}${p(d.getUTCDate())}`;
 }
 
+// Predictions already requested by this page or isolate, keyed by URL
+// (station and date range), so a forecast rebuilt after a preference
+// change, or another spot on the same station, reuses them instead of
+// asking NOAA again. Entries hold the pending promise, so concurrent
+// callers share one request; failed requests are dropped so the next
+// call retries.
+const CACHE_TTL_MS = EDGE_CACHE_SECONDS * 1000;
+const cache = new Map();
+
 // Returns Map<"YYYY-MM-DDTHH:00", feet>. `startUtcMs` should be the
-// start of the forecast window; the request spans `days` days.
+// start of the forecast window; the request spans `days` days. Callers
+// share the returned map and must not modify it.
 export async function fetchTides(stationId, startUtcMs, days = 7) {
-  const begin = new Date(startUtcMs - 86400000); // pad a day on each side
-  const end = new Date(startUtcMs + (days + 1) * 86400000);
+  // The window is `days` local dates starting today, but the range is
+  // in UTC dates: pad the start a day for zones behind UTC, where the
+  // UTC date can already be tomorrow. Ending `days` UTC dates out then
+  // covers the last local date in zones on either side of UTC.
+  const begin = new Date(startUtcMs - 86400000);
+  const end = new Date(startUtcMs + days * 86400000);
   const params = new URLSearchParams({
     product: "predictions",
     application: "PaddleCast",
@@ -27,7 +47,23 @@ export async function fetchTides(stationId, startUtcMs, days = 7) {
     interval: "h",
     format: "json",
   });
-  const res = await fetch(`${BASE_URL}?${params}`);
+  const url = `${BASE_URL}?${params}`;
+  const now = Date.now();
+  for (const [key, entry] of cache) {
+    if (now - entry.at >= CACHE_TTL_MS) cache.delete(key);
+  }
+  if (!cache.has(url)) {
+    const hours = requestTides(url);
+    cache.set(url, { at: now, hours });
+    hours.catch(() => {
+      if (cache.get(url)?.hours === hours) cache.delete(url);
+    });
+  }
+  return cache.get(url).hours;
+}
+
+async function requestTides(url) {
+  const res = await fetchWithRetry(url, edgeCache(EDGE_CACHE_SECONDS));
   if (!res.ok) throw new Error(`NOAA tides request failed (${res.status})`);
   const data = await res.json();
   if (data.error) {
@@ -35,8 +71,11 @@ export async function fetchTides(stationId, startUtcMs, days = 7) {
   }
   const hours = new Map();
   for (const p of data.predictions ?? []) {
-    // p.t is "YYYY-MM-DD HH:MM" in station-local time.
-    hours.set(p.t.replace(" ", "T").slice(0, 13) + ":00", parseFloat(p.v));
+    // p.t is "YYYY-MM-DD HH:MM" in station-local time; the key is the
+    // same hour in Open-Meteo's "YYYY-MM-DDTHH:00" form, cut straight
+    // from the fixed-width string.
+    const t = p.t;
+    hours.set(`${t.slice(0, 10)}T${t.slice(11, 13)}:00`, parseFloat(p.v));
   }
   return hours;
 }
@@ -8,13 +8,19 @@
 // because every shipped location is on the California coast; revisit if
 // locations ever span timezones.
 
+import { fetchWithRetry, edgeCache } from "./http.js";
+
 const TIMEZONE = "America/Los_Angeles";
 
 const WEATHER_URL = "https://api.open-meteo.com/v1/forecast";
 const MARINE_URL = "https://marine-api.open-meteo.com/v1/marine";
 
+// Open-Meteo refreshes its models hourly at best, so an edge copy a few
+// minutes old is as current as a fresh request.
+const EDGE_CACHE_SECONDS = 600;
+
 async function getJson(url) {
-  const res = await fetch(url);
+  const res = await fetchWithRetry(url, edgeCache(EDGE_CACHE_SECONDS));
   if (!res.ok) {
     throw new Error(`Open-Meteo request failed (${res.status}): ${url}`);
   }
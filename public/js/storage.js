@@ -11,16 +11,33 @@ import { getDefaultLocations } from "./config.js";
 
 const KEY = "paddlecast.v1";
 
+// The parsed state, reused while the stored string is unchanged. Every
+// render reads settings and every page reads locations, so this skips
+// re-parsing the whole state each time while still seeing writes from
+// other tabs. Writers mutate what load() returns and save() it, which
+// keeps the two in step.
+let cachedRaw;
+let cachedState;
+
 function load() {
   try {
-    return JSON.parse(localStorage.getItem(KEY)) ?? {};
+    const raw = localStorage.getItem(KEY);
+    if (raw !== cachedRaw) {
+      cachedState = JSON.parse(raw) ?? {};
+      cachedRaw = raw;
+    }
+    return cachedState;
   } catch {
     return {};
   }
 }
 
 function save(state) {
-  localStorage.setItem(KEY, JSON.stringify(state));
+  const raw = JSON.stringify(state);
+  cachedRaw = undefined; // re-read from storage if the write throws
+  localStorage.setItem(KEY, raw);
+  cachedRaw = raw;
+  cachedState = state;
 }
 
 export function getSettings() {
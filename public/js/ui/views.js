@@ -11,6 +11,15 @@ const METRIC_META = {
 
 const WEEKDAYS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"];
 
+// Built once: toLocaleDateString with options sets up a new formatter on
+// every call, and the day view formats a date per navigation chip.
+const DATE_LINE_FORMAT = new Intl.DateTimeFormat(undefined, {
+  weekday: "long",
+  month: "long",
+  day: "numeric",
+});
+const WEEKDAY_FORMAT = new Intl.DateTimeFormat(undefined, { weekday: "long" });
+
 function el(tag, className, text) {
   const node = document.createElement(tag);
   if (className) node.className = className;
@@ -73,10 +82,7 @@ export function renderDayView(forecast, dayIndex, { onPickDay }) {
 
   const header = el("header", "day-header");
   header.appendChild(el("h1", "loc-title", forecast.location.name));
-  const dateLine = new Date(day.date + "T12:00:00").toLocaleDateString(
-    undefined,
-    { weekday: "long", month: "long", day: "numeric" }
-  );
+  const dateLine = DATE_LINE_FORMAT.format(new Date(day.date + "T12:00:00"));
   header.appendChild(el("h2", "day-date", dateLine));
   header.appendChild(
     el(
@@ -98,7 +104,7 @@ export function renderDayView(forecast, dayIndex, { onPickDay }) {
     const chip = el("button", "day-chip");
     chip.classList.toggle("active", i === dayIndex);
     const date = new Date(d.date + "T12:00:00");
-    const long = `${date.toLocaleDateString(undefined, { weekday: "long" })} ` +
+    const long = `${WEEKDAY_FORMAT.format(date)} ` +
       `${date.getMonth() + 1}/${date.getDate()}`;
     chip.appendChild(el("span", "day-chip-long", long));
     chip.appendChild(el("span", "day-chip-short", weekdayOf(d.date).toUpperCase()));
@@ -136,6 +142,10 @@ export function renderDayView(forecast, dayIndex, { onPickDay }) {
   thead.appendChild(headRow);
   table.appendChild(thead);
 
+  // Every cell's dot takes one of four category colors. Resolve each
+  // against the scheme the first time it appears rather than per cell.
+  const dotColors = {};
+
   const tbody = el("tbody");
   for (const hour of day.hours) {
     const tr = el("tr");
@@ -149,7 +159,10 @@ export function renderDayView(forecast, dayIndex, { onPickDay }) {
       if (metric) {
         const wrap = el("span", "dt-cell-wrap");
         const dot = el("span", "dt-dot", METRIC_META[key].icon);
-        dot.style.background = categoryColor(metric.category, scheme);
+        if (!(metric.category in dotColors)) {
+          dotColors[metric.category] = categoryColor(metric.category, scheme);
+        }
+        dot.style.background = dotColors[metric.category];
         wrap.appendChild(dot);
         // The arrow sits between dot and value so it reads as part of
         // this metric, not the next column's. Direction degrees are
@@ -207,11 +220,12 @@ export function renderWeekTable(entries) {
 
   // The days shown are the union of every forecast's dates, so the
   // columns stay aligned even if one location is missing a day.
-  const dates = [...new Set(
-    entries.flatMap(({ forecast }) =>
-      forecast instanceof Error ? [] : forecast.days.map((d) => d.date)
-    )
-  )].sort();
+  const seen = new Set();
+  for (const { forecast } of entries) {
+    if (forecast instanceof Error) continue;
+    for (const day of forecast.days) seen.add(day.date);
+  }
+  const dates = [...seen].sort();
 
   const table = el("table", "week-table");
   const thead = el("thead");
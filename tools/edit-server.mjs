@@ -12,7 +12,7 @@
 // Binds to localhost only. Zero dependencies.
 
 import { createServer } from "node:http";
-import { readFile, writeFile } from "node:fs/promises";
+import { readFile, writeFile, stat } from "node:fs/promises";
 import { join, normalize, extname } from "node:path";
 import { fileURLToPath } from "node:url";
 
@@ -80,8 +80,19 @@ async function serveStatic(req, res) {
     return;
   }
   try {
+    // Files are revalidated on every load rather than refetched: the
+    // ETag comes from size and mtime, so an unchanged file answers with
+    // an empty 304, while an edit or a config save changes it.
+    const info = await stat(filePath);
+    const etag = `W/"${info.size.toString(16)}-${Math.floor(info.mtimeMs).toString(16)}"`;
+    const headers = { "cache-control": "no-cache", etag };
+    if (req.headers["if-none-match"] === etag) {
+      send(res, 304, undefined, headers);
+      return;
+    }
     const body = await readFile(filePath);
     send(res, 200, body, {
+      ...headers,
       "content-type": MIME[extname(filePath)] ?? "application/octet-stream",
     });
   } catch {